@@ -1,10 +1,236 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import io
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
-from typing import Optional, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TYPE_CHECKING,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from fsspec.spec import AbstractFileSystem
+
+# fsspec is imported on first use rather than at module import, which keeps
+# `import cloud_path` cheap for CLIs and serverless cold starts.
+
+
+@functools.cache
+def _abstractfs() -> type:
+    """Import and return fsspec's AbstractFileSystem class."""
+    from fsspec.spec import AbstractFileSystem
+
+    return AbstractFileSystem
+
+
+@functools.cache
+def _asyncfs() -> type:
+    """Import and return fsspec's AsyncFileSystem class."""
+    from fsspec.asyn import AsyncFileSystem
+
+    return AsyncFileSystem
+
+
+def _is_async(filesystem: AbstractFileSystem) -> bool:
+    """Return True if the filesystem's coroutines can be awaited on the caller's loop.
+
+    Args:
+        filesystem (AbstractFileSystem): The filesystem to check.
+
+    Returns:
+        bool: True for async filesystems instantiated with ``asynchronous=True``.
+    """
+    return isinstance(filesystem, _asyncfs()) and getattr(
+        filesystem, "asynchronous", False
+    )
+
+
+def _uses_own_loop(filesystem: AbstractFileSystem) -> bool:
+    """Return True if the filesystem's coroutines must run on its own event loop.
+
+    Args:
+        filesystem (AbstractFileSystem): The filesystem to check.
+
+    Returns:
+        bool: True for async filesystems instantiated with ``asynchronous=False``.
+    """
+    return isinstance(filesystem, _asyncfs()) and not _is_async(filesystem)
+
+
+def _join_parts(parts: Iterable[str]) -> str:
+    """Join path strings with "/" without going through pathlib.
+
+    A "protocol://" prefix and the leading "/" of the first part (after any
+    prefix, as in "file:///tmp") are kept; empty and "." segments are dropped,
+    so slashes at either end of any part and repeated slashes collapse.
+
+    Args:
+        parts (Iterable[str]): The path strings to join.
+
+    Returns:
+        str: The joined path, or "" if there are no segments and no root.
+    """
+    first, *rest = parts
+    head = ""
+    if "://" in first:
+        protocol, first = first.split("://", 1)
+        head = protocol + "://"
+    if first.startswith("/"):
+        head += "/"
+    segments = [
+        segment
+        for part in (first, *rest)
+        for segment in part.split("/")
+        if segment and segment != "."
+    ]
+    return head + "/".join(segments)
+
+
+def _map_filesystem(
+    filesystem: AbstractFileSystem, method: str, fs_paths: List[str], max_workers: int
+) -> list:
+    """Call a filesystem method on many paths concurrently.
+
+    Async filesystems run the ``_<method>`` coroutines on their own event
+    loop; sync filesystems use a thread pool. Either way at most
+    ``max_workers`` calls are in flight at once.
+
+    Args:
+        filesystem (AbstractFileSystem): The filesystem to call.
+        method (str): Name of the (sync) filesystem method to call.
+        fs_paths (List[str]): The paths to pass to the method, one call each.
+        max_workers (int): Maximum number of concurrent calls.
+
+    Returns:
+        list: The results, in the same order as ``fs_paths``.
+    """
+    if _uses_own_loop(filesystem):
+        from fsspec.asyn import sync
+
+        coro = getattr(filesystem, f"_{method}")
+
+        async def _gather():
+            semaphore = asyncio.Semaphore(max_workers)
+
+            async def _call(fs_path):
+                async with semaphore:
+                    return await coro(fs_path)
+
+            return await asyncio.gather(*(_call(fs_path) for fs_path in fs_paths))
+
+        return sync(filesystem.loop, _gather)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(getattr(filesystem, method), fs_paths))
 
-from fsspec.spec import AbstractFileSystem
+
+# Base delay in seconds for the randomized exponential backoff between retries
+_RETRY_BACKOFF = 0.1
+
+# Errors that will not go away by asking again
+_NON_RETRYABLE = (FileNotFoundError, IsADirectoryError, PermissionError)
+
+
+async def _hedged_async(make_coro: Callable[[], Awaitable], hedge_after: float):
+    """Await a coroutine, starting a duplicate if the first is slow.
+
+    Args:
+        make_coro (Callable[[], Awaitable]): Creates a new attempt each call.
+        hedge_after (float): Seconds to wait before starting the duplicate.
+
+    Returns:
+        Any: The result of whichever attempt succeeds first.
+    """
+    first = asyncio.ensure_future(make_coro())
+    done, _ = await asyncio.wait([first], timeout=hedge_after)
+    if done:
+        return first.result()
+
+    pending = {first, asyncio.ensure_future(make_coro())}
+    error = None
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task.exception() is None:
+                for loser in pending:
+                    loser.cancel()
+                return task.result()
+            error = error or task.exception()
+    raise error
+
+
+def _hedged_threaded(func: Callable, hedge_after: float):
+    """Call a function in a thread, starting a duplicate if the first is slow.
+
+    The slower call cannot be interrupted; it is left to finish in the
+    background and its result is discarded.
+
+    Args:
+        func (Callable): Performs one attempt each call.
+        hedge_after (float): Seconds to wait before starting the duplicate.
+
+    Returns:
+        Any: The result of whichever attempt succeeds first.
+    """
+    executor = ThreadPoolExecutor(max_workers=2)
+    try:
+        first = executor.submit(func)
+        done, _ = wait([first], timeout=hedge_after)
+        if done:
+            return first.result()
+
+        pending = {first, executor.submit(func)}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = error or future.exception()
+        raise error
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Opt-in metadata cache, enabled with CloudPath.enable_info_cache().
+# Maps (id(filesystem), path) to (expiry, info); info is None for missing paths.
+_info_cache: "OrderedDict[Tuple[int, str], Tuple[float, Optional[dict]]]" = (
+    OrderedDict()
+)
+_info_cache_lock = threading.Lock()
+_info_cache_ttl: Optional[float] = None
+_info_cache_maxsize = 10_000
+# Bumped on every invalidation, so that an info() call which overlapped a
+# modification does not store its possibly stale result.
+_info_cache_epoch = 0
 
 
 class CloudPath(Path):
+    # Filesystems created from URLs, keyed by protocol and storage options, so
+    # that every CloudPath on the same store shares one connection pool.
+    _fs_cache: Dict[str, AbstractFileSystem] = {}
+
+    # Size of each ranged read and multi-part upload chunk
+    BLOCK_SIZE = 8 * 2**20
+
     # def __init__(self, *args, filesystem: AbstractFileSystem = None):
     #     if isinstance(args[-1], AbstractFileSystem):
     #         self.filesystem = args[-1]
@@ -25,25 +251,46 @@ class CloudPath(Path):
         Returns:
             CloudPath: An initialized CloudPath object.
         """
-        if filesystem is None and isinstance(args[-1], AbstractFileSystem):
-            path = Path(*args[:-1])
+        # Fast path for the most common call, CloudPath(str, filesystem=fs)
+        if len(args) == 1 and isinstance(args[0], str) and filesystem is not None:
+            path_str = _join_parts(args) or "."
+            obj = super().__new__(cls, path_str)
+            obj.filesystem = filesystem
+            obj._fs_path_str = path_str
+            return obj
+
+        if filesystem is None and isinstance(args[-1], _abstractfs()):
             filesystem = args[-1]
-        else:
-            # Join multiple path components
-            path = Path(*args)
+            args = args[:-1]
+        elif filesystem is None and isinstance(args[0], str) and "://" in args[0]:
+            # Resolve "protocol://..." URLs to a shared filesystem
+            filesystem, fs_path = cls._filesystem_from_url(args[0])
+            args = (fs_path, *args[1:])
 
         # If any component is a CloudPath, inherit its filesystem
-        if any(isinstance(arg, CloudPath) for arg in args):
-            cloud_arg = next(arg for arg in args if isinstance(arg, CloudPath))
-            filesystem = cloud_arg.filesystem
+        if filesystem is None:
+            for arg in args:
+                if isinstance(arg, CloudPath):
+                    filesystem = arg.filesystem
+                    break
 
         # If we do not have an explicit filesystem, return a regular Path object
         if not filesystem:
-            return super().__new__(Path, str(path))
+            return Path(*args)
+
+        # Join string components directly; pathlib would also collapse the
+        # "//" of a "protocol://" prefix
+        path_str = ""
+        if all(isinstance(arg, (str, CloudPath)) for arg in args):
+            path_str = _join_parts(str(arg) for arg in args)
+        if not path_str:
+            path_str = str(Path(*args))
 
         # Create the CloudPath instance
-        obj = super().__new__(cls, str(path))
+        obj = super().__new__(cls, path_str)
         obj.filesystem = filesystem
+        # Cache the string form; every filesystem call needs it
+        obj._fs_path_str = path_str
 
         return obj
 
@@ -58,22 +305,101 @@ class CloudPath(Path):
             *args (Union[str, Path, "CloudPath", AbstractFileSystem]): Objects that can be joined to form a path.
             filesystem (AbstractFileSystem, optional): The filesystem to use. Defaults to None.
         """
-        if any([isinstance(arg, AbstractFileSystem) for arg in args]):
-            self.filesystem = next(
-                arg for arg in args if isinstance(arg, AbstractFileSystem)
-            )
-        if not self.filesystem:
-            if filesystem:
-                self.filesystem = filesystem
-            elif args and isinstance(args[-1], AbstractFileSystem):
-                self.filesystem = args[-1]
-                args = args[:-1]
-        if args and isinstance(args[-1], AbstractFileSystem):
-            self.filesystem = args[-1]
-            args = args[:-1]
+        # __new__ has already resolved the filesystem and joined the components
+        super().__init__(self._fs_path_str)
+
+    @classmethod
+    def _filesystem_from_url(
+        cls, url: str, **storage_options
+    ) -> Tuple[AbstractFileSystem, str]:
+        """Get the cached filesystem for a URL, creating it on first use.
+
+        Args:
+            url (str): A URL with a protocol, e.g. "s3://bucket/key".
+            **storage_options: Options passed to the filesystem constructor.
+
+        Returns:
+            Tuple[AbstractFileSystem, str]: The filesystem and the URL stripped of its protocol.
+        """
+        import fsspec
+        from fsspec.core import split_protocol
+        from fsspec.utils import tokenize
 
-        path = Path(*args)
-        super().__init__(path)
+        protocol, _ = split_protocol(url)
+        key = tokenize(protocol, storage_options)
+        filesystem = cls._fs_cache.get(key)
+        if filesystem is None:
+            filesystem = fsspec.filesystem(protocol, **storage_options)
+            cls._fs_cache[key] = filesystem
+        return filesystem, filesystem._strip_protocol(url)
+
+    @classmethod
+    def from_url(cls, url: str, **storage_options) -> "CloudPath":
+        """Create a CloudPath from a URL, reusing a cached filesystem.
+
+        Args:
+            url (str): A URL with a protocol, e.g. "s3://bucket/key".
+            **storage_options: Options passed to the filesystem constructor.
+
+        Returns:
+            CloudPath: A CloudPath on the filesystem for the URL's protocol.
+        """
+        filesystem, fs_path = cls._filesystem_from_url(url, **storage_options)
+        return cls(fs_path, filesystem=filesystem)
+
+    @classmethod
+    def cached(
+        cls, url: str, cache_storage: Optional[str] = None, **storage_options
+    ) -> "CloudPath":
+        """Create a CloudPath whose files are cached on local disk after first read.
+
+        Useful for objects that are read repeatedly, such as metadata files.
+        The cache is not invalidated when the remote object changes.
+
+        Args:
+            url (str): A URL with a protocol, e.g. "s3://bucket/key".
+            cache_storage (Optional[str], optional): Local directory for cached
+                files. Defaults to a "cloud_path" directory under the system
+                temporary directory.
+            **storage_options: Options passed to the remote filesystem constructor.
+
+        Returns:
+            CloudPath: A CloudPath on a SimpleCacheFileSystem wrapping the
+                filesystem for the URL's protocol.
+        """
+        from fsspec.implementations.cached import SimpleCacheFileSystem
+        from fsspec.utils import tokenize
+
+        target, fs_path = cls._filesystem_from_url(url, **storage_options)
+        cache_storage = cache_storage or os.path.join(
+            tempfile.gettempdir(), "cloud_path"
+        )
+        key = tokenize("simplecache", id(target), cache_storage)
+        filesystem = cls._fs_cache.get(key)
+        if filesystem is None:
+            filesystem = SimpleCacheFileSystem(fs=target, cache_storage=cache_storage)
+            cls._fs_cache[key] = filesystem
+        return cls(fs_path, filesystem=filesystem)
+
+    @classmethod
+    def _from_parsed(cls, path_str: str, fs: AbstractFileSystem) -> "CloudPath":
+        """Create a CloudPath from a path string already produced by the filesystem.
+
+        Skips the argument inspection and joining done by the constructor; used
+        for the (potentially many) paths yielded by listings.
+
+        Args:
+            path_str (str): A single path string, as returned by ``fs.ls``/``fs.glob``.
+            fs (AbstractFileSystem): The filesystem the path belongs to.
+
+        Returns:
+            CloudPath: The new CloudPath.
+        """
+        obj = super().__new__(cls, path_str)
+        super(CloudPath, obj).__init__(path_str)
+        obj.filesystem = fs
+        obj._fs_path_str = path_str
+        return obj
 
     def _get_fs_path(self) -> str:
         """Return the path as a string.
@@ -81,7 +407,7 @@ class CloudPath(Path):
         Returns:
             str: The path as a string.
         """
-        return super().__str__()  # str(super(CloudPath, self))
+        return self._fs_path_str
 
     def ls(self):
         """Get the files and directories in the path.
@@ -95,32 +421,158 @@ class CloudPath(Path):
 
     def glob(self, pattern: str, *, recursive: bool = False):
         for item in self.filesystem.glob(self._get_fs_path() + "/" + pattern):
-            yield CloudPath(item, filesystem=self.filesystem)
+            yield self._from_parsed(item, self.filesystem)
+
+    @classmethod
+    def enable_info_cache(cls, ttl: float = 30, maxsize: int = 10_000):
+        """Cache path metadata so exists/is_dir/is_file share one request.
+
+        Entries are dropped when the path is modified through a CloudPath, and
+        otherwise expire after ``ttl`` seconds.
+
+        Args:
+            ttl (float, optional): Seconds to keep each entry. Defaults to 30.
+            maxsize (int, optional): Maximum number of entries, evicted least
+                recently used first. Defaults to 10_000.
+        """
+        global _info_cache_ttl, _info_cache_maxsize
+        _info_cache_ttl = ttl
+        _info_cache_maxsize = maxsize
+
+    @classmethod
+    def disable_info_cache(cls):
+        """Disable and clear the metadata cache."""
+        global _info_cache_ttl
+        _info_cache_ttl = None
+        with _info_cache_lock:
+            _info_cache.clear()
+
+    def _info(self) -> Optional[dict]:
+        """Get the filesystem info for the path, using the cache if enabled.
+
+        Returns:
+            Optional[dict]: The info, or None if the path does not exist.
+        """
+        fs_path = self._get_fs_path()
+        key = (id(self.filesystem), fs_path)
+        now = time.monotonic()
+        with _info_cache_lock:
+            entry = _info_cache.get(key)
+            if entry is not None and entry[0] > now:
+                _info_cache.move_to_end(key)
+                return entry[1]
+            epoch = _info_cache_epoch
+
+        try:
+            info = self.filesystem.info(fs_path)
+        except FileNotFoundError:
+            info = None
+
+        if _info_cache_ttl is not None:
+            with _info_cache_lock:
+                if epoch != _info_cache_epoch:
+                    return info
+                _info_cache[key] = (now + _info_cache_ttl, info)
+                _info_cache.move_to_end(key)
+                while len(_info_cache) > _info_cache_maxsize:
+                    _info_cache.popitem(last=False)
+        return info
+
+    def _forget_info(self):
+        """Drop the cached metadata for the path after it has been modified."""
+        global _info_cache_epoch
+        with _info_cache_lock:
+            _info_cache_epoch += 1
+            _info_cache.pop((id(self.filesystem), self._get_fs_path()), None)
+
+    @contextlib.contextmanager
+    def _invalidating(self, *others: "CloudPath"):
+        """Drop the cached metadata of this and ``others`` once the block exits.
+
+        Invalidating after the change, rather than before, keeps a lookup made
+        while the change is in flight from caching the old state.
+
+        Args:
+            *others (CloudPath): Further paths modified by the block.
+        """
+        try:
+            yield
+        finally:
+            for path in (self, *others):
+                path._forget_info()
 
     def exists(self, *args, **kwargs) -> bool:
+        if _info_cache_ttl is not None:
+            return self._info() is not None
         return self.filesystem.exists(self._get_fs_path())
 
     def is_dir(self) -> bool:
+        if _info_cache_ttl is not None:
+            info = self._info()
+            return info is not None and info["type"] == "directory"
         return self.filesystem.isdir(self._get_fs_path())
 
     def is_file(self) -> bool:
+        if _info_cache_ttl is not None:
+            info = self._info()
+            return info is not None and info["type"] == "file"
         return self.filesystem.isfile(self._get_fs_path())
 
     def iterdir(self):
         for item in self.filesystem.ls(self._get_fs_path()):
-            yield CloudPath(item, filesystem=self.filesystem)
+            yield self._from_parsed(item, self.filesystem)
+
+    def iterdir_parallel(
+        self,
+        op: Optional[Callable[["CloudPath"], Any]] = None,
+        prefetch: int = 16,
+    ) -> Iterator[Tuple["CloudPath", Any]]:
+        """Apply an operation to each child, keeping a window of calls in flight.
+
+        Up to ``prefetch`` children are processed ahead of the consumer; as
+        each result is yielded the next child is submitted.
+
+        Args:
+            op (Callable[[CloudPath], Any], optional): The operation to apply to
+                each child. Defaults to reading its bytes.
+            prefetch (int, optional): Number of concurrent operations. Defaults to 16.
+
+        Yields:
+            Tuple[CloudPath, Any]: Each child and its result, in listing order.
+        """
+        if op is None:
+            op = CloudPath.read_bytes
+        children = self.iterdir()
+        executor = ThreadPoolExecutor(max_workers=prefetch)
+        try:
+            window = deque(
+                (child, executor.submit(op, child))
+                for _, child in zip(range(prefetch), children)
+            )
+            while window:
+                child, future = window.popleft()
+                next_child = next(children, None)
+                if next_child is not None:
+                    window.append((next_child, executor.submit(op, next_child)))
+                yield child, future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def mkdir(self, mode=0o777, parents=False, exist_ok=False):
-        if not exist_ok and self.exists():
-            raise FileExistsError(f"Directory '{self}' already exists")
-        self.filesystem.makedirs(self._get_fs_path(), exist_ok=exist_ok)
+        try:
+            with self._invalidating():
+                self.filesystem.makedirs(self._get_fs_path(), exist_ok=exist_ok)
+        except FileExistsError as e:
+            raise FileExistsError(f"Directory '{self}' already exists") from e
 
     def rmdir(self):
-        self.filesystem.rmdir(self._get_fs_path())
+        with self._invalidating():
+            self.filesystem.rmdir(self._get_fs_path())
 
     def unlink(self, missing_ok=False):
         try:
-            self.filesystem.delete(self._get_fs_path())
+            with self._invalidating():
+                self.filesystem.delete(self._get_fs_path())
         except FileNotFoundError:
             if not missing_ok:
                 raise
@@ -132,11 +584,31 @@ class CloudPath(Path):
         self.unlink(missing_ok)
 
     def open(self, mode="r", *args, **kwargs):
-        return self.filesystem.open(self._get_fs_path(), mode, *args, **kwargs)
+        f = self.filesystem.open(self._get_fs_path(), mode, *args, **kwargs)
+        if any(char in mode for char in "wax+"):
+            # The file is only complete once closed
+            close = f.close
+
+            def _close():
+                with self._invalidating():
+                    close()
+
+            f.close = _close
+        return f
 
     def read_text(
-        self, encoding: Optional[str] = None, errors: Optional[str] = None
+        self,
+        encoding: Optional[str] = None,
+        errors: Optional[str] = None,
+        hedge_after: Optional[float] = None,
+        retries: int = 0,
     ) -> str:
+        if hedge_after is not None or retries:
+            data = self.read_bytes(hedge_after=hedge_after, retries=retries)
+            # Decode as text mode would, so newlines translate as in open("r").
+            return io.TextIOWrapper(
+                io.BytesIO(data), encoding=encoding, errors=errors
+            ).read()
         with self.open("r") as f:
             return f.read()
 
@@ -150,26 +622,484 @@ class CloudPath(Path):
         with self.open("w") as f:
             f.write(data)
 
-    def read_bytes(self) -> bytes:
-        with self.open("rb") as f:
-            return f.read()
+    def _read_bytes_once(self, hedge_after: Optional[float] = None) -> bytes:
+        """Read the file, optionally hedging against a slow response.
+
+        Args:
+            hedge_after (Optional[float], optional): Seconds to wait before issuing
+                a duplicate request. Defaults to None (no hedging).
+
+        Returns:
+            bytes: The contents of the file.
+        """
+        if hedge_after is None:
+            return self.filesystem.cat_file(self._get_fs_path())
+
+        fs = self.filesystem
+        if _uses_own_loop(fs):
+            from fsspec.asyn import sync
+
+            fs_path = self._get_fs_path()
+            return sync(
+                fs.loop, _hedged_async, lambda: fs._cat_file(fs_path), hedge_after
+            )
+        return _hedged_threaded(self._read_bytes_once, hedge_after)
+
+    def _read_ranges(self, block_size: int, parallel: int) -> bytes:
+        """Read the file as concurrent byte ranges of ``block_size``.
 
-    def write_bytes(self, data: bytes):
-        with self.open("wb") as f:
+        Args:
+            block_size (int): Size of each range.
+            parallel (int): Maximum number of ranges in flight.
+
+        Returns:
+            bytes: The contents of the file.
+        """
+        fs = self.filesystem
+        fs_path = self._get_fs_path()
+        size = fs.size(fs_path)
+        if size <= block_size:
+            return fs.cat_file(fs_path)
+
+        starts = list(range(0, size, block_size))
+        ends = [min(start + block_size, size) for start in starts]
+        if _uses_own_loop(fs):
+            chunks = fs.cat_ranges(
+                [fs_path] * len(starts),
+                starts,
+                ends,
+                batch_size=parallel,
+                on_error="raise",
+            )
+        else:
+            with ThreadPoolExecutor(max_workers=parallel) as executor:
+                chunks = executor.map(
+                    lambda start, end: fs.cat_file(fs_path, start, end), starts, ends
+                )
+        return b"".join(chunks)
+
+    def read_bytes(
+        self,
+        hedge_after: Optional[float] = None,
+        retries: int = 0,
+        block_size: Optional[int] = None,
+        parallel: int = 1,
+    ) -> bytes:
+        """Read the contents of the file.
+
+        Args:
+            hedge_after (Optional[float], optional): Seconds to wait for a response
+                before issuing a duplicate request and taking whichever returns
+                first, e.g. the backend's p95 latency. Only applies to
+                single-request reads. Defaults to None.
+            retries (int, optional): Number of times to retry transient errors,
+                with randomized exponential backoff. Defaults to 0.
+            block_size (Optional[int], optional): Size of each ranged read when
+                ``parallel`` > 1. Defaults to CloudPath.BLOCK_SIZE.
+            parallel (int, optional): Number of concurrent ranged reads used to
+                download large files. Defaults to 1 (a single request).
+
+        Raises:
+            ValueError: If ``retries`` is negative.
+
+        Returns:
+            bytes: The contents of the file.
+        """
+        if retries < 0:
+            raise ValueError(f"retries must be non-negative, got {retries}")
+        for attempt in range(retries + 1):
+            try:
+                if parallel > 1:
+                    return self._read_ranges(block_size or self.BLOCK_SIZE, parallel)
+                return self._read_bytes_once(hedge_after)
+            except _NON_RETRYABLE:
+                raise
+            except OSError:
+                if attempt == retries:
+                    raise
+                time.sleep(random.uniform(0, _RETRY_BACKOFF * 2**attempt))
+
+    def write_bytes(self, data: bytes, block_size: Optional[int] = None):
+        """Write bytes to the file.
+
+        Data larger than one block is streamed through a file opened with that
+        block size, which fsspec backends upload as a multi-part upload.
+
+        Args:
+            data (bytes): The data to write.
+            block_size (Optional[int], optional): Upload part size. Defaults to
+                CloudPath.BLOCK_SIZE.
+        """
+        block_size = block_size or self.BLOCK_SIZE
+        if len(data) <= block_size:
+            with self._invalidating():
+                self.filesystem.pipe_file(self._get_fs_path(), data)
+            return
+        with self.open("wb", block_size=block_size) as f:
             f.write(data)
 
     def rename(self, target: Union[str, Path]) -> "CloudPath":
-        self.filesystem.mv(self._get_fs_path(), str(target))
-        return CloudPath(str(target), filesystem=self.filesystem)
+        target = CloudPath(str(target), filesystem=self.filesystem)
+        with self._invalidating(target):
+            self.filesystem.mv(self._get_fs_path(), str(target))
+        return target
+
+    async def _acall(self, method: str, *args, **kwargs):
+        """Run a filesystem method without blocking the event loop.
+
+        Async filesystems are awaited directly through their ``_<method>``
+        coroutine; all others are run in a worker thread.
+
+        Args:
+            method (str): Name of the (sync) filesystem method to call.
+
+        Returns:
+            Any: The result of the filesystem call.
+        """
+        coro = getattr(self.filesystem, f"_{method}", None)
+        if _is_async(self.filesystem) and coro is not None:
+            return await coro(*args, **kwargs)
+        return await asyncio.to_thread(
+            getattr(self.filesystem, method), *args, **kwargs
+        )
+
+    async def als(self):
+        return await self._acall("ls", self._get_fs_path())
+
+    async def aglob(self, pattern: str) -> List["CloudPath"]:
+        items = await self._acall("glob", self._get_fs_path() + "/" + pattern)
+        return [self._from_parsed(item, self.filesystem) for item in items]
+
+    async def aexists(self) -> bool:
+        return await self._acall("exists", self._get_fs_path())
+
+    async def ais_dir(self) -> bool:
+        return await self._acall("isdir", self._get_fs_path())
+
+    async def ais_file(self) -> bool:
+        return await self._acall("isfile", self._get_fs_path())
+
+    async def aiterdir(self) -> List["CloudPath"]:
+        items = await self._acall("ls", self._get_fs_path())
+        return [self._from_parsed(item, self.filesystem) for item in items]
+
+    async def amkdir(self, exist_ok=False):
+        try:
+            with self._invalidating():
+                await self._acall("makedirs", self._get_fs_path(), exist_ok=exist_ok)
+        except FileExistsError as e:
+            raise FileExistsError(f"Directory '{self}' already exists") from e
+
+    async def aunlink(self, missing_ok=False):
+        try:
+            with self._invalidating():
+                await self._acall("rm_file", self._get_fs_path())
+        except FileNotFoundError:
+            if not missing_ok:
+                raise
+
+    async def arename(self, target: Union[str, Path]) -> "CloudPath":
+        target = CloudPath(str(target), filesystem=self.filesystem)
+        with self._invalidating(target):
+            await self._acall("mv", self._get_fs_path(), str(target))
+        return target
+
+    async def aread_bytes(self) -> bytes:
+        if _is_async(self.filesystem):
+            return await self.filesystem._cat_file(self._get_fs_path())
+        return await asyncio.to_thread(self.read_bytes)
+
+    async def aread_text(
+        self, encoding: Optional[str] = None, errors: Optional[str] = None
+    ) -> str:
+        if _is_async(self.filesystem):
+            data = await self.filesystem._cat_file(self._get_fs_path())
+            return io.TextIOWrapper(
+                io.BytesIO(data), encoding=encoding, errors=errors
+            ).read()
+        return await asyncio.to_thread(self.read_text, encoding, errors)
+
+    async def awrite_bytes(self, data: bytes):
+        if _is_async(self.filesystem):
+            with self._invalidating():
+                await self.filesystem._pipe_file(self._get_fs_path(), data)
+        else:
+            await asyncio.to_thread(self.write_bytes, data)
+
+    async def awrite_text(
+        self,
+        data: str,
+        encoding: Optional[str] = None,
+        errors: Optional[str] = None,
+    ):
+        if _is_async(self.filesystem):
+            buffer = io.BytesIO()
+            with io.TextIOWrapper(buffer, encoding=encoding, errors=errors) as f:
+                f.write(data)
+                f.flush()
+                encoded = buffer.getvalue()
+            with self._invalidating():
+                await self.filesystem._pipe_file(self._get_fs_path(), encoded)
+        else:
+            await asyncio.to_thread(self.write_text, data, encoding, errors)
+
+    @classmethod
+    async def gather(
+        cls, paths: Iterable["CloudPath"], op: str = "exists", *args, **kwargs
+    ) -> list:
+        """Run the same async operation on many paths concurrently.
+
+        Args:
+            paths (Iterable[CloudPath]): The paths to operate on.
+            op (str, optional): Name of the operation without the ``a`` prefix,
+                e.g. ``"exists"`` or ``"read_bytes"``. Defaults to "exists".
+            *args, **kwargs: Passed through to each ``a<op>`` call.
+
+        Returns:
+            list: The results, in the same order as ``paths``.
+        """
+        return await asyncio.gather(
+            *(getattr(path, f"a{op}")(*args, **kwargs) for path in paths)
+        )
+
+    @staticmethod
+    def _group_by_filesystem(
+        paths: Iterable["CloudPath"],
+    ) -> List[List["CloudPath"]]:
+        """Split paths into groups that share a filesystem instance.
+
+        Args:
+            paths (Iterable[CloudPath]): The paths to group.
+
+        Returns:
+            List[List[CloudPath]]: The groups, in order of first appearance.
+        """
+        groups = defaultdict(list)
+        for path in paths:
+            groups[id(path.filesystem)].append(path)
+        return list(groups.values())
+
+    @classmethod
+    def _batch(
+        cls, paths: Iterable["CloudPath"], method: str, max_workers: int
+    ) -> Dict["CloudPath", object]:
+        """Call a filesystem method on many paths, grouped by filesystem.
+
+        Args:
+            paths (Iterable[CloudPath]): The paths to operate on.
+            method (str): Name of the (sync) filesystem method to call.
+            max_workers (int): Maximum number of concurrent calls.
+
+        Returns:
+            Dict[CloudPath, object]: The result for each path.
+        """
+        results = {}
+        for group in cls._group_by_filesystem(paths):
+            fs_paths = [path._get_fs_path() for path in group]
+            values = _map_filesystem(group[0].filesystem, method, fs_paths, max_workers)
+            results.update(zip(group, values))
+        return results
+
+    @classmethod
+    def cat_many(cls, paths: Iterable["CloudPath"]) -> Dict["CloudPath", bytes]:
+        """Read many files with one bulk call per filesystem.
+
+        Args:
+            paths (Iterable[CloudPath]): The files to read.
+
+        Returns:
+            Dict[CloudPath, bytes]: The contents of each file.
+        """
+        results = {}
+        for group in cls._group_by_filesystem(paths):
+            fs_paths = [path._get_fs_path() for path in group]
+            values = group[0].filesystem.cat_ranges(
+                fs_paths, None, None, on_error="raise"
+            )
+            results.update(zip(group, values))
+        return results
+
+    @classmethod
+    def read_bytes_many(
+        cls, paths: Iterable["CloudPath"], max_workers: int = 16
+    ) -> Dict["CloudPath", bytes]:
+        """Read many files concurrently.
+
+        Args:
+            paths (Iterable[CloudPath]): The files to read.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to 16.
+
+        Returns:
+            Dict[CloudPath, bytes]: The contents of each file.
+        """
+        return cls._batch(paths, "cat_file", max_workers)
+
+    @classmethod
+    def write_bytes_many(cls, data: Dict["CloudPath", bytes], max_workers: int = 16):
+        """Write many files concurrently.
+
+        Async backends receive one bulk ``pipe`` per filesystem; other backends
+        write each file in a thread pool.
+
+        Args:
+            data (Dict[CloudPath, bytes]): The data to write to each file.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to 16.
+        """
+        for group in cls._group_by_filesystem(data):
+            fs = group[0].filesystem
+            if _uses_own_loop(fs):
+                with group[0]._invalidating(*group[1:]):
+                    fs.pipe(
+                        {path._get_fs_path(): data[path] for path in group},
+                        batch_size=max_workers,
+                    )
+                continue
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(path.write_bytes, data[path]) for path in group
+                ]
+                for future in as_completed(futures):
+                    future.result()
+
+    @classmethod
+    def rm_many(
+        cls,
+        paths: Iterable["CloudPath"],
+        max_parallel: int = 50,
+        missing_ok: bool = False,
+    ):
+        """Delete many files concurrently.
+
+        Async backends (e.g. S3, GCS) receive one bulk delete per filesystem;
+        other backends delete each file in a thread pool.
+
+        Args:
+            paths (Iterable[CloudPath]): The files to delete.
+            max_parallel (int, optional): Threads used for sync filesystems. Defaults to 50.
+            missing_ok (bool, optional): Ignore files that do not exist. Defaults to False.
+
+        Raises:
+            FileNotFoundError: If a file does not exist and ``missing_ok`` is False.
+        """
+        for group in cls._group_by_filesystem(paths):
+            fs = group[0].filesystem
+            if _uses_own_loop(fs):
+                try:
+                    with group[0]._invalidating(*group[1:]):
+                        fs.rm([path._get_fs_path() for path in group])
+                    continue
+                except FileNotFoundError:
+                    if not missing_ok:
+                        raise
+                # Some files were missing: delete the rest one by one
+
+            with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+                futures = [executor.submit(path.unlink, missing_ok) for path in group]
+                for future in as_completed(futures):
+                    future.result()
+
+    @classmethod
+    def rename_many(
+        cls,
+        pairs: Iterable[Tuple["CloudPath", Union[str, Path]]],
+        max_parallel: int = 50,
+    ) -> List["CloudPath"]:
+        """Rename many files concurrently.
+
+        Args:
+            pairs (Iterable[Tuple[CloudPath, Union[str, Path]]]): (source, target) pairs.
+            max_parallel (int, optional): Number of concurrent renames. Defaults to 50.
+
+        Returns:
+            List[CloudPath]: The renamed paths, in the same order as ``pairs``.
+        """
+        with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+            futures = [
+                executor.submit(source.rename, target) for source, target in pairs
+            ]
+            for future in as_completed(futures):
+                future.result()
+        return [future.result() for future in futures]
+
+    @classmethod
+    def exists_batch(
+        cls, paths: Iterable["CloudPath"], max_workers: int = 16
+    ) -> Dict["CloudPath", bool]:
+        """Check whether many paths exist with one burst of requests per filesystem.
+
+        Args:
+            paths (Iterable[CloudPath]): The paths to check.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to 16.
+
+        Returns:
+            Dict[CloudPath, bool]: Whether each path exists.
+        """
+        return cls._batch(paths, "exists", max_workers)
+
+    @classmethod
+    def info_batch(
+        cls, paths: Iterable["CloudPath"], max_workers: int = 16
+    ) -> Dict["CloudPath", dict]:
+        """Fetch the metadata of many paths with one burst of requests per filesystem.
+
+        Args:
+            paths (Iterable[CloudPath]): The paths to look up.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to 16.
+
+        Raises:
+            FileNotFoundError: If any of the paths does not exist.
+
+        Returns:
+            Dict[CloudPath, dict]: The filesystem ``info`` for each path.
+        """
+        return cls._batch(paths, "info", max_workers)
+
+    @classmethod
+    def glob_batch(
+        cls, patterns: Iterable["CloudPath"], max_workers: int = 16
+    ) -> Dict["CloudPath", List["CloudPath"]]:
+        """Expand many glob patterns with one burst of requests per filesystem.
+
+        Args:
+            patterns (Iterable[CloudPath]): Full patterns, e.g. ``root / "*.txt"``.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to 16.
+
+        Returns:
+            Dict[CloudPath, List[CloudPath]]: The matches for each pattern.
+        """
+        return {
+            pattern: [cls._from_parsed(item, pattern.filesystem) for item in items]
+            for pattern, items in cls._batch(patterns, "glob", max_workers).items()
+        }
 
     def __truediv__(self, other: str) -> "CloudPath":
-        return CloudPath(self._get_fs_path(), other, filesystem=self.filesystem)
+        path_str = _join_parts((self._fs_path_str, str(other)))
+        return CloudPath._from_parsed(path_str, self.filesystem)
 
     def __str__(self) -> str:
-        return super().__str__()
+        return self._fs_path_str
+
+    __fspath__ = _get_fs_path
 
     def __repr__(self) -> str:
-        return f"CloudPath('{self._get_fs_path()}')"
+        return f"CloudPath('{self._fs_path_str}')"
+
+    def __hash__(self) -> int:
+        # Hash the path string only, as PurePath does: a plain Path with the
+        # same string compares equal (PurePath.__eq__ decides that comparison),
+        # so it must also hash equal. Paths on different filesystems merely
+        # collide.
+        return super().__hash__()
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CloudPath):
+            # Defer to PurePath.__eq__ so both operand orders agree
+            return NotImplemented
+        return (
+            self.filesystem is other.filesystem
+            and self._fs_path_str == other._fs_path_str
+        )
 
 
 # Example usage:
@@ -1,3 +1,9 @@
+import asyncio
+import io
+import os
+import subprocess
+import sys
+import time
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -5,6 +11,7 @@ from unittest.mock import Mock
 
 from cloud_path import CloudPath
 from fsspec import filesystem
+from fsspec.asyn import AsyncFileSystem, get_loop
 from fsspec.spec import AbstractFileSystem
 
 
@@ -15,14 +22,90 @@ class TestCloudPath(unittest.TestCase):
             "/path/to/resource", filesystem=self.mock_filesystem
         )
 
+    def test_import_does_not_load_fsspec(self):
+        code = "import sys, cloud_path; print('fsspec' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parents[1],
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+
     def test_new_with_filesystem(self):
         self.assertIsInstance(self.cloud_path, CloudPath)
         self.assertEqual(self.cloud_path.filesystem, self.mock_filesystem)
 
+    def test_new_single_string(self):
+        cloud_path = CloudPath("bucket/dir/", filesystem=self.mock_filesystem)
+        self.assertEqual(cloud_path, CloudPath("bucket", "dir", self.mock_filesystem))
+        self.assertEqual(cloud_path.name, "dir")
+        self.assertEqual(
+            CloudPath("/", filesystem=self.mock_filesystem)._get_fs_path(), "/"
+        )
+
     def test_new_without_filesystem(self):
         local_path = CloudPath("/local/path")
         self.assertIsInstance(local_path, Path)
         self.assertNotIsInstance(local_path, CloudPath)
+        self.assertEqual(str(local_path), "/local/path")
+
+    def test_new_joins_components(self):
+        cloud_path = CloudPath("s3://bucket", "key", filesystem=self.mock_filesystem)
+        self.assertEqual(cloud_path._get_fs_path(), "s3://bucket/key")
+        self.assertEqual(cloud_path.name, "key")
+        for args, expected in [
+            (("/a", "/b"), "/a/b"),
+            (("/a/", "/b/"), "/a/b"),
+            (("/a/./b",), "/a/b"),
+            (("/a", "./b", "."), "/a/b"),
+            (("/a", "", "b"), "/a/b"),
+            (("s3://bucket/", "/key"), "s3://bucket/key"),
+            (("/",), "/"),
+            (("file:///tmp", "x"), "file:///tmp/x"),
+            (("memory:///a/",), "memory:///a"),
+        ]:
+            cloud_path = CloudPath(*args, filesystem=self.mock_filesystem)
+            self.assertEqual(cloud_path._get_fs_path(), expected)
+
+    def test_new_inherits_filesystem(self):
+        cloud_path = CloudPath(self.cloud_path, "key")
+        self.assertIs(cloud_path.filesystem, self.mock_filesystem)
+        other_filesystem = Mock(spec=AbstractFileSystem)
+        cloud_path = CloudPath(self.cloud_path, "key", filesystem=other_filesystem)
+        self.assertIs(cloud_path.filesystem, other_filesystem)
+
+    def test_new_with_url(self):
+        cloud_path = CloudPath("memory://bucket/key")
+        self.assertIsInstance(cloud_path, CloudPath)
+        self.assertEqual(cloud_path._get_fs_path(), "/bucket/key")
+        self.assertEqual(cloud_path.filesystem.protocol, "memory")
+
+    def test_from_url_reuses_filesystem(self):
+        first = CloudPath.from_url("memory://bucket/key1")
+        second = CloudPath.from_url("memory://bucket/key2")
+        self.assertIs(first.filesystem, second.filesystem)
+        self.assertEqual(second._get_fs_path(), "/bucket/key2")
+
+    def test_from_parsed(self):
+        cloud_path = CloudPath._from_parsed("bucket/dir/file", self.mock_filesystem)
+        self.assertEqual(
+            cloud_path, CloudPath("bucket/dir/file", filesystem=self.mock_filesystem)
+        )
+        self.assertIs(cloud_path.filesystem, self.mock_filesystem)
+        self.assertEqual(cloud_path.name, "file")
+
+    def test_cached(self):
+        remote = CloudPath.from_url("memory://bucket/cached.txt")
+        remote.write_bytes(b"file content")
+        with TemporaryDirectory() as tmpdir:
+            cloud_path = CloudPath.cached(
+                "memory://bucket/cached.txt", cache_storage=tmpdir
+            )
+            self.assertEqual(cloud_path.read_bytes(), b"file content")
+            remote.unlink()
+            self.assertEqual(cloud_path.read_bytes(), b"file content")
 
     def test_get_fs_path(self):
         self.assertEqual(self.cloud_path._get_fs_path(), "/path/to/resource")
@@ -60,6 +143,90 @@ class TestCloudPath(unittest.TestCase):
         self.assertTrue(self.cloud_path.is_file())
         self.mock_filesystem.isfile.assert_called_once_with("/path/to/resource")
 
+    def test_info_cache(self):
+        CloudPath.enable_info_cache(ttl=30)
+        self.addCleanup(CloudPath.disable_info_cache)
+        self.mock_filesystem.info.return_value = {"type": "directory"}
+        self.assertTrue(self.cloud_path.exists())
+        self.assertTrue(self.cloud_path.is_dir())
+        self.assertFalse(self.cloud_path.is_file())
+        self.mock_filesystem.info.assert_called_once_with("/path/to/resource")
+        self.mock_filesystem.exists.assert_not_called()
+
+        self.cloud_path.unlink()
+        self.mock_filesystem.info.side_effect = FileNotFoundError
+        self.assertFalse(self.cloud_path.exists())
+        self.assertEqual(self.mock_filesystem.info.call_count, 2)
+
+    def test_info_cache_expires(self):
+        CloudPath.enable_info_cache(ttl=0)
+        self.addCleanup(CloudPath.disable_info_cache)
+        self.mock_filesystem.info.return_value = {"type": "file"}
+        self.assertTrue(self.cloud_path.is_file())
+        self.assertTrue(self.cloud_path.is_file())
+        self.assertEqual(self.mock_filesystem.info.call_count, 2)
+
+    def test_info_cache_rm_many(self):
+        CloudPath.enable_info_cache(ttl=30)
+        self.addCleanup(CloudPath.disable_info_cache)
+        async_filesystem = Mock(spec=AsyncFileSystem)
+        async_filesystem.asynchronous = False
+        async_filesystem.info.return_value = {"type": "file"}
+        cloud_path = CloudPath("/file1", filesystem=async_filesystem)
+        self.assertTrue(cloud_path.exists())
+
+        CloudPath.rm_many([cloud_path])
+        async_filesystem.rm.assert_called_once_with(["/file1"])
+        async_filesystem.info.side_effect = FileNotFoundError
+        self.assertFalse(cloud_path.exists())
+
+    def test_info_cache_open_for_writing(self):
+        CloudPath.enable_info_cache(ttl=30)
+        self.addCleanup(CloudPath.disable_info_cache)
+        self.mock_filesystem.info.side_effect = FileNotFoundError
+        self.assertFalse(self.cloud_path.exists())
+
+        self.cloud_path.open("rb")
+        self.assertFalse(self.cloud_path.exists())
+        self.assertEqual(self.mock_filesystem.info.call_count, 1)
+
+        self.mock_filesystem.open.return_value = io.BytesIO()
+        with self.cloud_path.open("wb"):
+            self.assertFalse(self.cloud_path.exists())
+        self.mock_filesystem.info.side_effect = None
+        self.mock_filesystem.info.return_value = {"type": "file"}
+        self.assertTrue(self.cloud_path.exists())
+
+    def test_info_cache_lookup_during_write(self):
+        CloudPath.enable_info_cache(ttl=30)
+        self.addCleanup(CloudPath.disable_info_cache)
+        self.mock_filesystem.info.side_effect = FileNotFoundError
+
+        def pipe_file(path, data):
+            # A concurrent lookup sees (and caches) the state before the write
+            self.assertFalse(self.cloud_path.exists())
+            self.mock_filesystem.info.side_effect = None
+            self.mock_filesystem.info.return_value = {"type": "file"}
+
+        self.mock_filesystem.pipe_file.side_effect = pipe_file
+        self.cloud_path.write_bytes(b"new content")
+        self.assertTrue(self.cloud_path.exists())
+
+    def test_info_cache_write_during_lookup(self):
+        CloudPath.enable_info_cache(ttl=30)
+        self.addCleanup(CloudPath.disable_info_cache)
+
+        def info(path):
+            # A write completes while this lookup is still in flight
+            self.mock_filesystem.info.side_effect = None
+            self.mock_filesystem.info.return_value = {"type": "file"}
+            self.cloud_path.write_bytes(b"new content")
+            raise FileNotFoundError(path)
+
+        self.mock_filesystem.info.side_effect = info
+        self.assertFalse(self.cloud_path.exists())
+        self.assertTrue(self.cloud_path.exists())
+
     def test_iterdir(self):
         self.mock_filesystem.ls.return_value = ["file1", "file2"]
         result = list(self.cloud_path.iterdir())
@@ -72,6 +239,21 @@ class TestCloudPath(unittest.TestCase):
             ],
         )
 
+    def test_iterdir_parallel(self):
+        self.mock_filesystem.ls.return_value = [f"file{i}" for i in range(5)]
+        self.mock_filesystem.cat_file.side_effect = lambda path: path.encode()
+        result = list(self.cloud_path.iterdir_parallel(prefetch=2))
+        self.assertEqual(
+            result,
+            [
+                (
+                    CloudPath(f"file{i}", filesystem=self.mock_filesystem),
+                    f"file{i}".encode(),
+                )
+                for i in range(5)
+            ],
+        )
+
     def test_mkdir(self):
         self.mock_filesystem = filesystem("file")
         with TemporaryDirectory() as tmpdir:
@@ -83,6 +265,16 @@ class TestCloudPath(unittest.TestCase):
             self.cloud_path.mkdir(exist_ok=True)
             assert self.cloud_path.exists()
 
+            with self.assertRaises(FileExistsError):
+                self.cloud_path.mkdir(exist_ok=False)
+
+    def test_mkdir_skips_exists_check(self):
+        self.cloud_path.mkdir(exist_ok=False)
+        self.mock_filesystem.makedirs.assert_called_once_with(
+            "/path/to/resource", exist_ok=False
+        )
+        self.mock_filesystem.exists.assert_not_called()
+
     def test_rmdir(self):
         self.cloud_path.rmdir()
         self.mock_filesystem.rmdir.assert_called_once_with("/path/to/resource")
@@ -99,6 +291,35 @@ class TestCloudPath(unittest.TestCase):
         self.cloud_path.rm()
         self.mock_filesystem.delete.assert_called_once_with("/path/to/resource")
 
+    def test_rm_many(self):
+        paths = [self.cloud_path / "file1", self.cloud_path / "file2"]
+        self.mock_filesystem.delete.side_effect = [None, FileNotFoundError]
+        CloudPath.rm_many(paths, missing_ok=True)
+        self.assertEqual(self.mock_filesystem.delete.call_count, 2)
+
+    def test_rm_many_async_filesystem(self):
+        async_filesystem = Mock(spec=AsyncFileSystem)
+        async_filesystem.asynchronous = False
+        paths = [
+            CloudPath("/file1", filesystem=async_filesystem),
+            CloudPath("/file2", filesystem=async_filesystem),
+        ]
+        CloudPath.rm_many(paths)
+        async_filesystem.rm.assert_called_once_with(["/file1", "/file2"])
+        async_filesystem.delete.assert_not_called()
+
+    def test_rename_many(self):
+        pairs = [(self.cloud_path / "file1", "/new/file1"), (self.cloud_path, "/new")]
+        result = CloudPath.rename_many(pairs)
+        self.assertEqual(self.mock_filesystem.mv.call_count, 2)
+        self.assertEqual(
+            result,
+            [
+                CloudPath("/new/file1", filesystem=self.mock_filesystem),
+                CloudPath("/new", filesystem=self.mock_filesystem),
+            ],
+        )
+
     def test_open(self):
         mock_open = Mock()
         self.mock_filesystem.open.return_value = mock_open
@@ -132,6 +353,85 @@ class TestCloudPath(unittest.TestCase):
             result = self.cloud_path.read_bytes()
             self.assertEqual(result, b"file content")
 
+    def test_read_bytes_hedged(self):
+        responses = iter([(0.3, b"slow"), (0, b"fast")])
+
+        def cat_file(path):
+            delay, data = next(responses)
+            time.sleep(delay)
+            return data
+
+        self.mock_filesystem.cat_file.side_effect = cat_file
+        result = self.cloud_path.read_bytes(hedge_after=0.05)
+        self.assertEqual(result, b"fast")
+        self.assertEqual(self.mock_filesystem.cat_file.call_count, 2)
+
+    def test_read_bytes_hedged_async_filesystem(self):
+        async_filesystem = Mock(spec=AsyncFileSystem)
+        async_filesystem.asynchronous = False
+        async_filesystem.loop = get_loop()
+        responses = iter([(10, b"slow"), (0, b"fast")])
+
+        async def cat_file(path):
+            delay, data = next(responses)
+            await asyncio.sleep(delay)
+            return data
+
+        async_filesystem._cat_file.side_effect = cat_file
+        cloud_path = CloudPath("/path/to/resource", filesystem=async_filesystem)
+        self.assertEqual(cloud_path.read_bytes(hedge_after=0.05), b"fast")
+
+    def test_read_bytes_retries(self):
+        self.mock_filesystem.cat_file.side_effect = [
+            OSError("503 Service Unavailable"),
+            b"file content",
+        ]
+        self.assertEqual(self.cloud_path.read_bytes(retries=1), b"file content")
+
+        self.mock_filesystem.cat_file.side_effect = FileNotFoundError
+        with self.assertRaises(FileNotFoundError):
+            self.cloud_path.read_bytes(retries=3)
+        self.assertEqual(self.mock_filesystem.cat_file.call_count, 3)
+
+        with self.assertRaises(ValueError):
+            self.cloud_path.read_bytes(retries=-1)
+
+    def test_read_text_retries_newlines(self):
+        self.mock_filesystem = filesystem("file")
+        with TemporaryDirectory() as tmpdir:
+            file_path = Path(tmpdir) / "file.txt"
+            file_path.write_bytes(b"a\r\nb\rc\n")
+            self.cloud_path = CloudPath(file_path, filesystem=self.mock_filesystem)
+            self.assertEqual(self.cloud_path.read_text(), "a\nb\nc\n")
+            self.assertEqual(self.cloud_path.read_text(retries=1), "a\nb\nc\n")
+            self.assertEqual(self.cloud_path.read_text(hedge_after=10), "a\nb\nc\n")
+
+    def test_read_bytes_parallel(self):
+        self.mock_filesystem = filesystem("file")
+        with TemporaryDirectory() as tmpdir:
+            file_path = Path(tmpdir) / "file.txt"
+            file_path.write_bytes(b"0123456789")
+            self.cloud_path = CloudPath(file_path, filesystem=self.mock_filesystem)
+            result = self.cloud_path.read_bytes(block_size=3, parallel=4)
+            self.assertEqual(result, b"0123456789")
+
+    def test_read_bytes_parallel_ranges(self):
+        self.mock_filesystem.size.return_value = 10
+        self.mock_filesystem.cat_file.side_effect = lambda path, start, end: bytes(
+            range(start, end)
+        )
+        result = self.cloud_path.read_bytes(block_size=4, parallel=2)
+        self.assertEqual(result, bytes(range(10)))
+        self.assertEqual(self.mock_filesystem.cat_file.call_count, 3)
+
+    def test_write_bytes_multipart(self):
+        self.mock_filesystem = filesystem("file")
+        with TemporaryDirectory() as tmpdir:
+            file_path = Path(tmpdir) / "file.txt"
+            self.cloud_path = CloudPath(file_path, filesystem=self.mock_filesystem)
+            self.cloud_path.write_bytes(b"0123456789", block_size=4)
+            self.assertEqual(file_path.read_bytes(), b"0123456789")
+
     def test_write_bytes(self):
         self.mock_filesystem = filesystem("file")
         with TemporaryDirectory() as tmpdir:
@@ -140,6 +440,65 @@ class TestCloudPath(unittest.TestCase):
             self.cloud_path.write_bytes(b"new content")
             self.assertEqual(file_path.read_bytes(), b"new content")
 
+    def test_cat_many(self):
+        self.mock_filesystem = filesystem("file")
+        with TemporaryDirectory() as tmpdir:
+            paths = []
+            for name in ["file1.txt", "file2.txt"]:
+                (Path(tmpdir) / name).write_bytes(name.encode())
+                paths.append(
+                    CloudPath(Path(tmpdir) / name, filesystem=self.mock_filesystem)
+                )
+            result = CloudPath.cat_many(paths)
+            self.assertEqual(result, {paths[0]: b"file1.txt", paths[1]: b"file2.txt"})
+
+    def test_read_write_bytes_many(self):
+        self.mock_filesystem = filesystem("file")
+        with TemporaryDirectory() as tmpdir:
+            data = {
+                CloudPath(Path(tmpdir) / name, filesystem=self.mock_filesystem): (
+                    name.encode()
+                )
+                for name in ["file1.txt", "file2.txt", "file3.txt"]
+            }
+            CloudPath.write_bytes_many(data)
+            self.assertEqual(CloudPath.read_bytes_many(data), data)
+
+    def test_write_bytes_many_async_filesystem(self):
+        async_filesystem = Mock(spec=AsyncFileSystem)
+        async_filesystem.asynchronous = False
+        data = {
+            CloudPath("/file1", filesystem=async_filesystem): b"1",
+            CloudPath("/file2", filesystem=async_filesystem): b"2",
+        }
+        CloudPath.write_bytes_many(data)
+        async_filesystem.pipe.assert_called_once_with(
+            {"/file1": b"1", "/file2": b"2"}, batch_size=16
+        )
+
+    def test_read_bytes_many_limits_async_concurrency(self):
+        async_filesystem = Mock(spec=AsyncFileSystem)
+        async_filesystem.asynchronous = False
+        async_filesystem.loop = get_loop()
+        in_flight = peak = 0
+
+        async def cat_file(path):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return path.encode()
+
+        async_filesystem._cat_file.side_effect = cat_file
+        paths = [
+            CloudPath(f"/file{i}", filesystem=async_filesystem) for i in range(100)
+        ]
+        result = CloudPath.read_bytes_many(paths, max_workers=4)
+        self.assertEqual(result[paths[42]], b"/file42")
+        self.assertEqual(async_filesystem._cat_file.await_count, 100)
+        self.assertEqual(peak, 4)
+
     def test_rename(self):
         new_path = self.cloud_path.rename("/new/path")
         self.mock_filesystem.mv.assert_called_once_with(
@@ -149,6 +508,13 @@ class TestCloudPath(unittest.TestCase):
             new_path, CloudPath("/new/path", filesystem=self.mock_filesystem)
         )
 
+    def test_truediv_file_url(self):
+        self.mock_filesystem = filesystem("file")
+        with TemporaryDirectory() as tmpdir:
+            root = CloudPath(f"file://{tmpdir}", filesystem=self.mock_filesystem)
+            (root / "out.txt").write_bytes(b"new content")
+            self.assertEqual((Path(tmpdir) / "out.txt").read_bytes(), b"new content")
+
     def test_truediv(self):
         self.mock_filesystem = filesystem("file")
         self.cloud_path = CloudPath(
@@ -159,13 +525,143 @@ class TestCloudPath(unittest.TestCase):
             new_path,
             CloudPath("/path/to/resource/subdir", filesystem=self.mock_filesystem),
         )
+        self.assertEqual(
+            CloudPath("s3://bucket/", filesystem=self.mock_filesystem) / "key",
+            CloudPath("s3://bucket/key", filesystem=self.mock_filesystem),
+        )
+        for other in ["subdir/", "/subdir", "./subdir", "subdir/."]:
+            result = self.cloud_path / other
+            self.assertEqual(result._get_fs_path(), "/path/to/resource/subdir")
+            self.assertEqual(
+                result,
+                CloudPath("/path/to/resource/subdir/", filesystem=self.mock_filesystem),
+            )
+        self.assertEqual((self.cloud_path / "")._get_fs_path(), "/path/to/resource")
 
     def test_str(self):
         self.assertEqual(str(self.cloud_path), "/path/to/resource")
 
+    def test_fspath(self):
+        self.assertEqual(os.fspath(self.cloud_path), "/path/to/resource")
+
+    def test_eq_and_hash(self):
+        same = CloudPath("/path/to/resource", filesystem=self.mock_filesystem)
+        other = CloudPath("/path/to/resource", filesystem=Mock(spec=AbstractFileSystem))
+        self.assertEqual(self.cloud_path, same)
+        self.assertEqual(hash(self.cloud_path), hash(same))
+        self.assertNotEqual(self.cloud_path, other)
+        self.assertEqual(len({self.cloud_path, same, other}), 2)
+
+    def test_eq_and_hash_with_path(self):
+        local_path = Path("/path/to/resource")
+        self.assertEqual(local_path == self.cloud_path, self.cloud_path == local_path)
+        self.assertEqual(hash(local_path), hash(self.cloud_path))
+        self.assertEqual(len({local_path, self.cloud_path}), 1)
+        self.assertNotEqual(Path("/other"), self.cloud_path)
+
     def test_repr(self):
         self.assertEqual(repr(self.cloud_path), "CloudPath('/path/to/resource')")
 
+    def test_aexists(self):
+        self.mock_filesystem.exists.return_value = True
+        self.assertTrue(asyncio.run(self.cloud_path.aexists()))
+        self.mock_filesystem.exists.assert_called_once_with("/path/to/resource")
+
+    def test_aexists_async_filesystem(self):
+        async_filesystem = Mock(spec=AsyncFileSystem)
+        async_filesystem.asynchronous = True
+        async_filesystem._exists.return_value = True
+        cloud_path = CloudPath("/path/to/resource", filesystem=async_filesystem)
+        self.assertTrue(asyncio.run(cloud_path.aexists()))
+        async_filesystem._exists.assert_awaited_once_with("/path/to/resource")
+        async_filesystem.exists.assert_not_called()
+
+    def test_aiterdir(self):
+        self.mock_filesystem.ls.return_value = ["file1", "file2"]
+        result = asyncio.run(self.cloud_path.aiterdir())
+        self.assertEqual(
+            result,
+            [
+                CloudPath("file1", filesystem=self.mock_filesystem),
+                CloudPath("file2", filesystem=self.mock_filesystem),
+            ],
+        )
+
+    def test_aread_write_text(self):
+        self.mock_filesystem = filesystem("file")
+        with TemporaryDirectory() as tmpdir:
+            file_path = Path(tmpdir) / "file.txt"
+            cloud_path = CloudPath(file_path, filesystem=self.mock_filesystem)
+            asyncio.run(cloud_path.awrite_bytes(b"new content"))
+            self.assertEqual(asyncio.run(cloud_path.aread_text()), "new content")
+
+    def test_aread_write_text_async_filesystem(self):
+        async_filesystem = Mock(spec=AsyncFileSystem)
+        async_filesystem.asynchronous = True
+        async_filesystem._cat_file.return_value = b"a\r\nb\rc\n"
+        cloud_path = CloudPath("/path/to/resource", filesystem=async_filesystem)
+        self.assertEqual(asyncio.run(cloud_path.aread_text()), "a\nb\nc\n")
+
+        asyncio.run(cloud_path.awrite_text("a\nb", encoding="utf-16"))
+        async_filesystem._pipe_file.assert_awaited_once_with(
+            "/path/to/resource", "a\nb".replace("\n", os.linesep).encode("utf-16")
+        )
+
+    def test_amkdir(self):
+        self.mock_filesystem = filesystem("file")
+        with TemporaryDirectory() as tmpdir:
+            cloud_path = CloudPath(
+                Path(tmpdir) / "path", filesystem=self.mock_filesystem
+            )
+            asyncio.run(cloud_path.amkdir(exist_ok=False))
+            self.assertTrue(cloud_path.exists())
+
+            asyncio.run(cloud_path.amkdir(exist_ok=True))
+            with self.assertRaisesRegex(FileExistsError, "already exists"):
+                asyncio.run(cloud_path.amkdir(exist_ok=False))
+
+    def test_gather(self):
+        self.mock_filesystem.exists.side_effect = lambda path: path.endswith("1")
+        paths = [self.cloud_path / "file1", self.cloud_path / "file2"]
+        result = asyncio.run(CloudPath.gather(paths, op="exists"))
+        self.assertEqual(result, [True, False])
+
+    def test_exists_batch(self):
+        self.mock_filesystem.exists.side_effect = lambda path: path.endswith("1")
+        other_filesystem = Mock(spec=AbstractFileSystem)
+        other_filesystem.exists.return_value = True
+        paths = [
+            self.cloud_path / "file1",
+            self.cloud_path / "file2",
+            CloudPath("/other", filesystem=other_filesystem),
+        ]
+        result = CloudPath.exists_batch(paths)
+        self.assertEqual(result, dict(zip(paths, [True, False, True])))
+        other_filesystem.exists.assert_called_once_with("/other")
+
+    def test_info_batch_async_filesystem(self):
+        async_filesystem = Mock(spec=AsyncFileSystem)
+        async_filesystem.asynchronous = False
+        async_filesystem.loop = get_loop()
+        async_filesystem._info.side_effect = lambda path: {"name": path}
+        paths = [
+            CloudPath("/file1", filesystem=async_filesystem),
+            CloudPath("/file2", filesystem=async_filesystem),
+        ]
+        result = CloudPath.info_batch(paths)
+        self.assertEqual(result[paths[1]], {"name": "/file2"})
+        self.assertEqual(async_filesystem._info.await_count, 2)
+        async_filesystem.info.assert_not_called()
+
+    def test_glob_batch(self):
+        self.mock_filesystem.glob.return_value = ["file1"]
+        pattern = self.cloud_path / "*.txt"
+        result = CloudPath.glob_batch([pattern])
+        self.mock_filesystem.glob.assert_called_once_with("/path/to/resource/*.txt")
+        self.assertEqual(
+            result, {pattern: [CloudPath("file1", filesystem=self.mock_filesystem)]}
+        )
+
 
 if __name__ == "__main__":
     unittest.main()